@@ -1,603 +1,1001 @@
-"""
-SPARQL Burger - A Python SPARQL query builder for programmatically generating SPARQL graph patterns and queries.
-Version 0.1
-Official webpage: http://pmitzias.com/SPARQLBurger
-Documentation: http://pmitzias.com/SPARQLBurger/docs.html
-Created by Panos Mitzias (http://www.pmitzias.com)
-Powered by Catalink Ltd (http://catalink.eu)
-"""
-
-"""
-#   SPARQLSyntaxTerms.py edited by GE Research 05/20/2022, Copyright 2022 © General Electric Company, All Rights Reserved.
-
-#   The contents of this file represent a modified version of the original file: https://github.com/panmitz/SPARQL-Burger/blob/master/SPARQLBurger/SPARQLQueryBuilder.py.
-#   This research is based upon work supported in part by the Office of the Director of National Intelligence (ODNI),
-#   Intelligence Advanced Research Projects Activity (IARPA), via Contract # 2021-21022600004 (GER Proposal #20-378 (258732)).
-#   The views and conclusions contained herein are those of the authors and should not be interpreted as necessarily
-#   representing the official policies, either expressed or implied, of ODNI, IARPA, or the U.S. Government.
-#   The U.S. Government is authorized to reproduce and distribute reprints for governmental purposes notwithstanding any
-#   copyright annotation therein.
-"""
-
-from SPARQLBurger.SPARQLSyntaxTerms import *
-
-
-class SPARQLGraphPattern:
-    def __init__(self, optional=False, union=False):
-        """
-        The SPARQLGraphPattern class constructor.
-        :param optional: <bool> Indicates if graph pattern should be marked as OPTIONAL.
-        :param union: <bool> Indicates if graph pattern should have a UNION clause that associates it with the previous.
-        graph pattern
-        """
-        self.is_optional = optional
-        self.is_union = union
-        self.graph = []
-        self.filters = []
-        self.bindings = []
-        # MODIFICATION: The following member variable 'self.havings' was added by GE Research as part of the ProCure project
-        self.havings = []
-
-    def add_triples(self, triples):
-        """
-        Adds a list of triples to the graph pattern.
-        :param triples: <list> A list of SPARQLSyntaxTerms.Triple objects.
-        :return: <bool> True if addition succeeded, False if given argument was not a list of Triple objects.
-        """
-        if type(triples) is list and all(isinstance(element, Triple) for element in triples):
-            self.graph.extend(triples)
-            return True
-        else:
-            return False
-
-    def add_nested_graph_pattern(self, graph_pattern):
-        """
-        Adds another graph pattern as nested to the main graph pattern.
-        :param graph_pattern: <obj> The SPARQLGraphPattern object to be nested.
-        :return: <bool> True if addition succeeded, False if given argument was not a SPARQLGraphPattern object.
-        """
-        if type(graph_pattern) is SPARQLGraphPattern:
-            self.graph.append(graph_pattern)
-            return True
-        else:
-            return False
-
-    def add_nested_select_query(self, select_query):
-        """
-        Adds a select query as nested to the main graph pattern.
-        :param select_query: <obj> The SPARQLSelectQuery object to be nested.
-        :return: <bool> True if addition succeeded, False if given argument was not a SPARQLGraphPattern object.
-        """
-        if type(select_query) is SPARQLSelectQuery:
-            self.graph.append(select_query)
-            return True
-        else:
-            return False
-
-    def add_filter(self, filter):
-        """
-        Adds a FILTER expression to the graph pattern.
-        :param filter: <obj> The Filter to be added.
-        :return: <bool> True if addition succeeded, False if given argument was not a Filter object.
-        """
-        if type(filter) is Filter:
-            self.filters.append(filter)
-            return True
-        else:
-            return False
-
-    # MODIFICATION: The following method 'add_having' was added by GE Research as part of the ProCure project
-    def add_having(self, having):
-        """
-        Adds a HAVING expression to the graph pattern.
-        :param filter: <obj> The HAVING expression to be added.
-        :return: <bool> True if addition succeeded, False if given argument was not a Having object.
-        """
-        if type(having) is Having:
-            self.havings.append(having)
-            return True
-        else:
-            return False
-
-    def add_binding(self, binding):
-        """
-        Adds a BIND expression to the graph pattern.
-        :param binding: <obj> The Binding object to be added.
-        :return: <bool> True if addition succeeded, False if given argument was not a Binding object.
-        """
-        if type(binding) is Binding:
-            self.bindings.append(binding)
-            return True
-        else:
-            return False
-
-    def get_text(self, indentation_depth=0):
-        """
-        Generates the text for the SPARQL graph pattern.
-        :param indentation_depth: <int> A value that facilitates the appropriate addition of indents to the text. Defaults at 0.
-        :return: <str> The SPARQL graph pattern text. Returns empty string if an exception was raised.
-        """
-        try:
-            # Calculate indentations
-            outer_indentation = indentation_depth * "   "
-            inner_indentation = (indentation_depth + 1) * "   "
-
-            # Initialize string
-            if self.is_optional:
-                query_text = "%sOPTIONAL {\n" % (outer_indentation, )
-            elif self.is_union:
-                query_text = "%sUNION\n%s{\n" % (outer_indentation, outer_indentation)
-            else:
-                query_text = "%s{\n" % (outer_indentation, )
-
-            # Add triples
-            for entry in self.graph:
-                # If entry is a Triple object
-                if type(entry) is Triple:
-                    query_text += "%s%s" % (inner_indentation, entry.get_text())
-
-                # If entry is a nested SPARQLGraphPattern object
-                elif type(entry) is SPARQLGraphPattern:
-
-                    # Get text for nested graph pattern
-                    nested_graph_text = entry.get_text(indentation_depth=indentation_depth + 1)
-
-                    # Append nested text to graph text
-                    if nested_graph_text:
-                        query_text += nested_graph_text
-                    else:
-                        return False
-
-                # If entry is a nested SPARQLSelectQuery object
-                elif type(entry) is SPARQLSelectQuery:
-
-                    # Get the text for the nested select query
-                    nested_select_text = entry.get_text(indentation_depth=indentation_depth + 2)
-
-                    # Append nested text to graph text
-                    if nested_select_text:
-                        query_text += "%s{%s%s}\n" % (inner_indentation, nested_select_text, inner_indentation)
-                    else:
-                        return False
-
-            # Add binding texts
-            for binding in self.bindings:
-                query_text += "%s%s\n" % (inner_indentation, binding.get_text())
-
-            # Add filter texts
-            for filter in self.filters:
-                query_text += "%s%s\n" % (inner_indentation, filter.get_text())
-
-            # Finalize graph text
-            query_text += "%s}\n" % (outer_indentation, )
-
-            return query_text
-
-        except Exception as e:
-            print("Error 1 @ SPARQLGraphPattern.get_text()", e)
-            return ""
-
-
-class SPARQLQuery:
-    def __init__(self, include_popular_prefixes=False):
-        """
-        The SPARQLQuery class constructor.
-        :param include_popular_prefixes: <bool> If True, a list of popular namespaces will be added automatically
-        """
-        self.prefixes = []
-        self.where = None
-
-        if include_popular_prefixes:
-            self.add_popular_prefixes()
-
-    def add_prefix(self, prefix):
-        """
-        Adds a PREFIX expression to the graph pattern.
-        :param prefix: <obj> The Prefix object to be added.
-        :return: <bool> True if addition succeeded, False if given argument was not a Prefix object.
-        """
-        if type(prefix) is Prefix:
-            self.prefixes.append(prefix)
-            return True
-        else:
-            return False
-
-    def add_popular_prefixes(self):
-        popular_prefixes = {
-            "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-            "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
-            "xml": "http://www.w3.org/2001/XMLSchema#",
-            "owl": "http://www.w3.org/2002/07/owl#",
-            "prov": "http://www.w3.org/ns/prov#",
-            "foaf": "http://xmlns.com/foaf/0.1/"
-        }
-
-        for prefix in popular_prefixes:
-            self.add_prefix(
-                prefix=Prefix(
-                    prefix=prefix,
-                    namespace=popular_prefixes[prefix]
-                )
-            )
-
-    def set_where_pattern(self, graph_pattern):
-        """
-        Sets the SPARQLGraphPattern object to be used at the WHERE part
-        :param graph_pattern: <obj> The SPARQLGraphPattern object to be used.
-        :return: <bool> True if setting succeeded, False if given argument was not a SPARQLGraphPattern object.
-        """
-        if type(graph_pattern) is SPARQLGraphPattern:
-            self.where = graph_pattern
-            return True
-        else:
-            return False
-
-
-class SPARQLSelectQuery(SPARQLQuery):
-    def __init__(self, distinct=False, limit=False, include_popular_prefixes=False):
-        """
-        The SPARQLSelectQuery class constructor.
-        :param distinct: <bool> Indicates if the select should be SELECT DISTINCT.
-        :param limit: <int> A limit to be used for the select query results.
-        """
-        SPARQLQuery.__init__(self, include_popular_prefixes)
-
-        self.distinct = distinct
-        self.limit = limit
-        self.variables = []
-        self.group_by = []
-        self.having = []
-        self.order_by = []
-
-    def add_variables(self, variables):
-        """
-        Adds a list of variables to be selected by the select query
-        :param variables: <list> A list of variables as strings.
-        :return: <bool> True if addition succeeded, False if given argument was not a list of strings.
-        """
-        if type(variables) is list and all(isinstance(element, str) for element in variables):
-            self.variables.extend(variables)
-            return True
-        else:
-            return False
-
-    def add_group_by(self, group):
-        """
-        Adds a GROUP BY expression to the query
-        :param group: <obj> The GroupBy object to be added
-        :return: <bool> True if addition succeeded, False if given argument was not a GroupBy object.
-        """
-        if type(group) is GroupBy:
-            self.group_by.append(group)
-            return True
-        else:
-            return False
-
-    # MODIFICATION: The following method 'add_order_by' was added by GE Research as part of the ProCure project
-    def add_order_by(self, order):
-        """
-        Adds a ORDER BY expression to the query
-        :param group: <obj> The OrderBy object to be added
-        :return: <bool> True if addition succeeded, False if given argument was not a OrderBy object.
-        """
-        if type(order) is OrderBy:
-            self.order_by.append(order)
-            return True
-        else:
-            return False
-
-    # MODIFICATION: The following method 'add_having' was added by GE Research as part of the ProCure project
-    def add_having(self, having):
-        self.having.append(having)
-        return True
-
-    def get_text(self, indentation_depth=0):
-        """
-        Generates the text for the SPARQL select query.
-        :param indentation_depth: <int> A value that facilitates the appropriate addition of indents to the text. Defaults at 0.
-        :return: <str> The SPARQL Select query text. Returns empty string if an exception was raised.
-        """
-        try:
-            # Calculate indentation
-            outer_indentation = indentation_depth * "   "
-
-            # Initialize text string
-            query_text = ""
-
-            # Add prefixes
-            for prefix in self.prefixes:
-                query_text += prefix.get_text()
-
-            # Add SELECT token
-            if self.distinct:
-                distinct_token = "DISTINCT "
-            else:
-                distinct_token = ""
-            query_text += "\n%sSELECT %s" % (outer_indentation, distinct_token)
-
-            # If some variables have been defined, add them
-            if self.variables:
-                query_text += " ".join(self.variables)
-
-            # If no variable has been defined, use *
-            else:
-                query_text += " *"
-
-            # Add WHERE token
-            query_text += "\n%sWHERE " % (outer_indentation, )
-
-            # Add WHERE pattern graph
-            if self.where is not None:
-                query_text += self.where.get_text(indentation_depth=indentation_depth)[:-1]
-
-            # Add group by expressions
-            for group in self.group_by:
-                query_text += "\n%s%s" % (outer_indentation, group.get_text())
-
-            # MODIFICATION: The following for loop statement block was added by GE Research as part of the ProCure project
-            # Add having expressions
-            for have in self.having:
-                query_text += "\n%s%s" % (outer_indentation, have.get_text())
-
-            # MODIFICATION: The following for loop statement block was added by GE Research as part of the ProCure project
-            # Add order by expressions
-            for order in self.order_by:
-                query_text += "\n%s%s" % (outer_indentation, order.get_text())
-
-            # Add limit if required
-            if self.limit:
-                query_text += "\nLIMIT %s" % (str(self.limit))
-
-            return query_text
-
-        except Exception as e:
-            print("Error 1 @ SPARQLSelectQuery.get_text()", e)
-            return ""
-
-
-class SPARQLUpdateQuery(SPARQLQuery):
-    def __init__(self, include_popular_prefixes=False):
-        """
-        The SPARQLUpdateQuery class constructor.
-        """
-        SPARQLQuery.__init__(self, include_popular_prefixes)
-        self.delete = None
-        self.insert = None
-
-    def set_delete_pattern(self, graph_pattern):
-        """
-        Sets the SPARQLGraphPattern object to be used at the DELETE part
-        :param graph_pattern: <obj> The SPARQLGraphPattern object to be used.
-        :return: <bool> True if setting succeeded, False if given argument was not a SPARQLGraphPattern object.
-        """
-        if type(graph_pattern) is SPARQLGraphPattern:
-            self.delete = graph_pattern
-            return True
-        else:
-            return False
-
-    def set_insert_pattern(self, graph_pattern):
-        """
-        Sets the SPARQLGraphPattern object to be used at the INSERT part.
-        :param graph_pattern: <obj> The SPARQLGraphPattern object to be used.
-        :return: <bool> True if setting succeeded, False if given argument was not a SPARQLGraphPattern object.
-        """
-        if type(graph_pattern) is SPARQLGraphPattern:
-            self.insert = graph_pattern
-            return True
-        else:
-            return False
-
-    def get_text(self, indentation_depth=0):
-        """
-        Generates the text for the SPARQL update query.
-        :param indentation_depth: <int> A value that facilitates the appropriate addition of indents to the text. Defaults at 0.
-        :return: <str> The SPARQL Update query text. Returns empty string if an exception was raised.
-        """
-
-        try:
-            # Calculate indentation
-            outer_indentation = indentation_depth * "   "
-
-            # Initialize text string
-            query_text = ""
-
-            # Add prefixes
-            for prefix in self.prefixes:
-                query_text += prefix.get_text()
-
-            # If a delete graph pattern has been defined
-            if self.delete is not None:
-
-                # Add DELETE token
-                query_text += "\n%sDELETE " % (outer_indentation,)
-
-                # Add DELETE pattern graph
-                query_text += self.delete.get_text(indentation_depth=indentation_depth)[:-1]
-
-            # If an insert graph pattern has been defined
-            if self.insert is not None:
-                # Add INSERT token
-                query_text += "\n%sINSERT " % (outer_indentation,)
-
-                # Add INSERT pattern graph
-                query_text += self.insert.get_text(indentation_depth=indentation_depth)[:-1]
-
-            # If a where graph pattern has been defined
-            if self.where is not None:
-                # Add WHERE token
-                query_text += "\n%sWHERE " % (outer_indentation,)
-
-                # Add WHERE pattern graph
-                query_text += self.where.get_text(indentation_depth=indentation_depth)[:-1]
-
-            return query_text
-
-        except Exception as e:
-            print("Error 1 @ SPARQLUpdateQuery.get_text()", e)
-            return ""
-
-
-if __name__ == "__main__":
-
-    # Create a graph pattern
-    pattern = SPARQLGraphPattern()
-
-    # Add a triple
-    pattern.add_triples(
-        triples=[
-            Triple(subject="?person", predicate="rdf:type", object="ex:Person"),
-            Triple(subject="?person", predicate="ex:hasName", object="?name")
-        ]
-    )
-
-    # Create a second graph pattern that should be OPTIONAL
-    optional_pattern = SPARQLGraphPattern(optional=True)
-
-    # Add a triple to the optional graph pattern
-    optional_pattern.add_triples(
-        triples=[
-            Triple(subject="?person", predicate="ex:hasAge", object="?age")
-        ]
-    )
-
-    # Add optional graph pattern as nested to the main graph pattern
-    pattern.add_nested_graph_pattern(optional_pattern)
-
-    print(pattern.get_text())
-
-    # Add some binding (BIND clause) to the main pattern.
-    pattern.add_binding(
-        binding=Binding(
-            value="\'John\'@en",
-            variable="?name"
-        )
-    )
-
-    # Add another binding where we will use a nested IF clause with a BOUND clause
-    pattern.add_binding(
-        binding=Binding(
-            value=IfClause(
-                condition=Bound(
-                    variable="?age"
-                ),
-                true_value="?age",
-                false_value="32"
-            ),
-            variable="?years"
-        )
-    )
-
-    # Add a filter for the age to the optional pattern
-    optional_pattern.add_filter(
-        filter=Filter(
-            expression="?age > 30"
-        )
-    )
-
-    # Print the graph query text
-    # print(pattern.get_text())
-
-    # Create a select query
-    select_query = SPARQLSelectQuery(
-        distinct=True,
-        limit=1000
-    )
-
-    # Add prefix "ex"
-    select_query.add_prefix(
-        prefix=Prefix(
-            prefix="ex",
-            namespace="http://www.example.com#"
-        )
-    )
-
-    # Add the variables for the selection
-    select_query.add_variables("?person")
-    select_query.add_variables("?years")
-
-    # Set the graph pattern that we created earlier as the WHERE pattern
-    select_query.set_where_pattern(graph_pattern=pattern)
-
-    # Add a GROUP BY to query
-    select_query.add_group_by(
-        group=GroupBy(
-            variables=["?person", "?age"]
-        )
-    )
-
-    # # Create another graph pattern
-    # pattern_3 = SPARQLGraphPattern()
-    # pattern_3.add_triple(
-    #     triple=Triple(
-    #         subject="?person",
-    #         predicate="rdf:type",
-    #         object="ex:Customer"
-    #     )
-    # )
-    #
-    # # Create a new select query to be nested in the first select query
-    # nested_select_query = SPARQLSelectQuery()
-    # nested_select_query.add_variable("?person")
-    # nested_select_query.set_where_pattern(
-    #     graph_pattern=pattern_3
-    # )
-    #
-    # # Set the second query as nested to the first graph pattern
-    # pattern.add_nested_select_query(
-    #     select_query=nested_select_query
-    # )
-
-    # Print the query text
-    # print(select_query.get_text())
-
-    #########################################
-    # delete_pattern = SPARQLGraphPattern()
-    # delete_pattern.add_triple(
-    #     Triple(
-    #         subject="?person",
-    #         predicate="ex:hasAge",
-    #         object="?age"
-    #     )
-    # )
-    #
-    # insert_pattern = SPARQLGraphPattern()
-    # insert_pattern.add_triple(
-    #     Triple(
-    #         subject="?person",
-    #         predicate="ex:hasAge",
-    #         object="32"
-    #     )
-    # )
-    #
-    # where_pattern = SPARQLGraphPattern()
-    # where_pattern.add_triple(
-    #     Triple(
-    #         subject="?person",
-    #         predicate="ex:hasAge",
-    #         object="?age"
-    #     )
-    # )
-    # where_pattern.add_triple(
-    #     Triple(
-    #         subject="?person",
-    #         predicate="ex:name",
-    #         object="John"
-    #     )
-    # )
-    #
-    # # Create an update query
-    # update_query = SPARQLUpdateQuery()
-    # update_query.add_prefix(
-    #     Prefix(
-    #         prefix="ex",
-    #         namespace="http://www.example.com#"
-    #     )
-    # )
-    # update_query.set_delete_pattern(graph_pattern=delete_pattern)
-    # update_query.set_insert_pattern(graph_pattern=insert_pattern)
-    # update_query.set_where_pattern(graph_pattern=insert_pattern)
-    #
-    # print(update_query.get_text())
-
-
+"""
+SPARQL Burger - A Python SPARQL query builder for programmatically generating SPARQL graph patterns and queries.
+Version 0.1
+Official webpage: http://pmitzias.com/SPARQLBurger
+Documentation: http://pmitzias.com/SPARQLBurger/docs.html
+Created by Panos Mitzias (http://www.pmitzias.com)
+Powered by Catalink Ltd (http://catalink.eu)
+"""
+
+"""
+#   SPARQLSyntaxTerms.py edited by GE Research 05/20/2022, Copyright 2022 © General Electric Company, All Rights Reserved.
+
+#   The contents of this file represent a modified version of the original file: https://github.com/panmitz/SPARQL-Burger/blob/master/SPARQLBurger/SPARQLQueryBuilder.py.
+#   This research is based upon work supported in part by the Office of the Director of National Intelligence (ODNI),
+#   Intelligence Advanced Research Projects Activity (IARPA), via Contract # 2021-21022600004 (GER Proposal #20-378 (258732)).
+#   The views and conclusions contained herein are those of the authors and should not be interpreted as necessarily
+#   representing the official policies, either expressed or implied, of ODNI, IARPA, or the U.S. Government.
+#   The U.S. Government is authorized to reproduce and distribute reprints for governmental purposes notwithstanding any
+#   copyright annotation therein.
+"""
+
+import itertools
+import threading
+
+from SPARQLBurger.SPARQLSyntaxTerms import *
+
+# Optional C accelerator for the hot rendering paths (built from _fast.pyx when
+# Cython is available at install time); the pure-Python renderers are used otherwise
+try:
+    from SPARQLBurger._fast import triple_line as _triple_line_fast
+    from SPARQLBurger._fast import render_triples as _render_triples_fast
+except ImportError:
+    _triple_line_fast = None
+    _render_triples_fast = None
+
+# Globally unique, monotonic mutation stamps. Every mutator takes a fresh stamp,
+# and a subtree's version is the max stamp within it, so replacing a child can
+# never land the tree version back on a previously seen value.
+_MUTATION_COUNTER = itertools.count(1)
+
+# Set to False to skip the per-element type validation in the bulk mutators.
+# The validation is also skipped entirely when Python runs with -O.
+_VALIDATE = True
+
+# Precomputed indentation strings indexed by depth, to avoid re-multiplying on every get_text call
+_INDENT = tuple("   " * i for i in range(64))
+
+
+def _get_indentation(indentation_depth):
+    """
+    Returns the indentation string for the given depth.
+    :param indentation_depth: <int> The indentation depth.
+    :return: <str> The indentation string.
+    """
+    if indentation_depth < 64:
+        return _INDENT[indentation_depth]
+    return indentation_depth * "   "
+
+
+# Thread-local pool of reusable fragment lists, to avoid allocating a fresh list
+# for every top-level render in repeated-generation workloads
+_BUFFER_POOL = threading.local()
+
+# Maximum number of idle fragment lists kept per thread
+_BUFFER_POOL_SIZE = 8
+
+
+def _acquire_parts():
+    """
+    Returns a fragment list from the thread-local pool, or a new one if the pool is empty.
+    :return: <list> An empty list for collecting text fragments.
+    """
+    stack = getattr(_BUFFER_POOL, "stack", None)
+    if stack:
+        return stack.pop()
+    return []
+
+
+def _release_parts(parts):
+    """
+    Clears a fragment list and returns it to the thread-local pool for reuse.
+    Callers must be done with the list contents (i.e. have joined them) before releasing.
+    :param parts: <list> The fragment list to recycle.
+    """
+    parts.clear()
+    stack = getattr(_BUFFER_POOL, "stack", None)
+    if stack is None:
+        stack = _BUFFER_POOL.stack = []
+    if len(stack) < _BUFFER_POOL_SIZE:
+        stack.append(parts)
+
+
+# Popular namespace prefixes, built once at import so add_popular_prefixes is a single extend
+_POPULAR_PREFIXES = (
+    Prefix(prefix="rdf", namespace="http://www.w3.org/1999/02/22-rdf-syntax-ns#"),
+    Prefix(prefix="rdfs", namespace="http://www.w3.org/2000/01/rdf-schema#"),
+    Prefix(prefix="xml", namespace="http://www.w3.org/2001/XMLSchema#"),
+    Prefix(prefix="owl", namespace="http://www.w3.org/2002/07/owl#"),
+    Prefix(prefix="prov", namespace="http://www.w3.org/ns/prov#"),
+    Prefix(prefix="foaf", namespace="http://xmlns.com/foaf/0.1/"),
+)
+
+
+class SPARQLGraphPattern:
+    __slots__ = ("is_optional", "is_union", "graph", "filters", "bindings", "havings", "_cache", "_cache_enabled", "_version", "_compiled", "_all_triples")
+
+    def __init__(self, optional=False, union=False, cache=False):
+        """
+        The SPARQLGraphPattern class constructor.
+        :param optional: <bool> Indicates if graph pattern should be marked as OPTIONAL.
+        :param union: <bool> Indicates if graph pattern should have a UNION clause that associates it with the previous.
+        graph pattern
+        :param cache: <bool> If True, rendered text is memoized until the pattern or a nested pattern is
+        mutated through the add_* methods. Leave False (the default) when syntax term objects (e.g. Triple)
+        are mutated in place after being added, as such changes are not tracked.
+        """
+        self.is_optional = optional
+        self.is_union = union
+        self.graph = []
+        self.filters = []
+        self.bindings = []
+        # MODIFICATION: The following member variable 'self.havings' was added by GE Research as part of the ProCure project
+        self.havings = []
+        # Opt-in memoization state: latest render per (indentation_depth, trailing_newline),
+        # stored with the subtree version it was rendered at
+        self._cache = {}
+        self._cache_enabled = cache
+        self._version = 0
+        # Specialized renderer produced by compile(), discarded on mutation
+        self._compiled = None
+        # True while the graph holds only Triple entries, enabling batch rendering
+        self._all_triples = True
+
+    def add_triples(self, triples):
+        """
+        Adds a list of triples to the graph pattern.
+        :param triples: <list> A list of SPARQLSyntaxTerms.Triple objects.
+        :return: <bool> True if addition succeeded, False if given argument was not a list of Triple objects.
+        """
+        if type(triples) is not list:
+            return False
+        if __debug__ and _VALIDATE and not all(isinstance(element, Triple) for element in triples):
+            return False
+        self.graph.extend(triples)
+        self._invalidate()
+        return True
+
+    def add_triple(self, triple):
+        """
+        Adds a single triple to the graph pattern without the list validation overhead of add_triples.
+        Intended for hot construction loops that add triples one at a time.
+        :param triple: <obj> The SPARQLSyntaxTerms.Triple object to be added.
+        :return: <bool> True.
+        """
+        self.graph.append(triple)
+        self._invalidate()
+        return True
+
+    def add_nested_graph_pattern(self, graph_pattern):
+        """
+        Adds another graph pattern as nested to the main graph pattern.
+        :param graph_pattern: <obj> The SPARQLGraphPattern object to be nested.
+        :return: <bool> True if addition succeeded, False if given argument was not a SPARQLGraphPattern object.
+        """
+        if isinstance(graph_pattern, SPARQLGraphPattern):
+            self.graph.append(graph_pattern)
+            self._all_triples = False
+            self._invalidate()
+            return True
+        else:
+            return False
+
+    def add_nested_select_query(self, select_query):
+        """
+        Adds a select query as nested to the main graph pattern.
+        :param select_query: <obj> The SPARQLSelectQuery object to be nested.
+        :return: <bool> True if addition succeeded, False if given argument was not a SPARQLGraphPattern object.
+        """
+        if isinstance(select_query, SPARQLSelectQuery):
+            self.graph.append(select_query)
+            self._all_triples = False
+            self._invalidate()
+            return True
+        else:
+            return False
+
+    def add_filter(self, filter):
+        """
+        Adds a FILTER expression to the graph pattern.
+        :param filter: <obj> The Filter to be added.
+        :return: <bool> True if addition succeeded, False if the given object cannot render itself.
+        """
+        if __debug__ and _VALIDATE and not hasattr(filter, "get_text"):
+            return False
+        self.filters.append(filter)
+        self._invalidate()
+        return True
+
+    def add_filters(self, filters):
+        """
+        Adds a list of FILTER expressions to the graph pattern in a single extend.
+        :param filters: <list> A list of Filter objects.
+        :return: <bool> True if addition succeeded, False if given argument was not a list of objects that can render themselves.
+        """
+        if type(filters) is not list:
+            return False
+        if __debug__ and _VALIDATE and not all(hasattr(element, "get_text") for element in filters):
+            return False
+        self.filters.extend(filters)
+        self._invalidate()
+        return True
+
+    # MODIFICATION: The following method 'add_having' was added by GE Research as part of the ProCure project
+    def add_having(self, having):
+        """
+        Adds a HAVING expression to the graph pattern.
+        :param filter: <obj> The HAVING expression to be added.
+        :return: <bool> True if addition succeeded, False if the given object cannot render itself.
+        """
+        if __debug__ and _VALIDATE and not hasattr(having, "get_text"):
+            return False
+        self.havings.append(having)
+        self._invalidate()
+        return True
+
+    def add_binding(self, binding):
+        """
+        Adds a BIND expression to the graph pattern.
+        :param binding: <obj> The Binding object to be added.
+        :return: <bool> True if addition succeeded, False if the given object cannot render itself.
+        """
+        if __debug__ and _VALIDATE and not hasattr(binding, "get_text"):
+            return False
+        self.bindings.append(binding)
+        self._invalidate()
+        return True
+
+    def add_bindings(self, bindings):
+        """
+        Adds a list of BIND expressions to the graph pattern in a single extend.
+        :param bindings: <list> A list of Binding objects.
+        :return: <bool> True if addition succeeded, False if given argument was not a list of objects that can render themselves.
+        """
+        if type(bindings) is not list:
+            return False
+        if __debug__ and _VALIDATE and not all(hasattr(element, "get_text") for element in bindings):
+            return False
+        self.bindings.extend(bindings)
+        self._invalidate()
+        return True
+
+    def _invalidate(self):
+        """
+        Marks the graph pattern as modified with a fresh mutation stamp,
+        discarding any memoized renders.
+        """
+        self._version = next(_MUTATION_COUNTER)
+        self._cache.clear()
+        self._compiled = None
+
+    def compile(self, indentation_depth=0):
+        """
+        Compiles a specialized rendering function for the current shape of the pattern.
+        The generated function hard-codes the traversal order, indentation and all static
+        text, leaving only the subject/predicate/object of each Triple to be read at call
+        time. Useful for parameterized templates that are rendered many times: mutate the
+        Triple objects in place and call the compiled function again. The function checks
+        the subtree version on each call (like the memoizer) and recompiles transparently
+        when this pattern or any nested pattern or query has been structurally mutated.
+        :param indentation_depth: <int> The indentation depth to bake into the render. Defaults at 0.
+        :return: <callable> A zero-argument function returning the pattern text.
+        """
+        specialized = self._compile_specialized(indentation_depth)
+        compiled_version = self._tree_version()
+
+        def render():
+            nonlocal specialized, compiled_version
+            current_version = self._tree_version()
+            if current_version != compiled_version:
+                specialized = self._compile_specialized(indentation_depth)
+                compiled_version = current_version
+            return specialized()
+
+        self._compiled = render
+        return render
+
+    def _compile_specialized(self, indentation_depth):
+        """
+        Builds the raw specialized rendering function for the current pattern shape.
+        :param indentation_depth: <int> The indentation depth to bake into the render.
+        :return: <callable> A zero-argument function returning the pattern text.
+        """
+        static_buffer = []
+        code_parts = []
+        namespace = {}
+        self._compile_parts(indentation_depth, True, static_buffer, code_parts, namespace)
+        _flush_static(static_buffer, code_parts)
+        source = "def _compiled_render():\n    return " + " + ".join(code_parts)
+        exec(source, namespace)
+        return namespace["_compiled_render"]
+
+    def _compile_parts(self, indentation_depth, trailing_newline, static_buffer, code_parts, namespace):
+        """
+        Emits the source expressions for a specialized render of this pattern.
+        Static text accumulates in static_buffer; dynamic Triple slots are flushed
+        into code_parts as f-string expressions over objects placed in namespace.
+        """
+        outer_indentation = _get_indentation(indentation_depth)
+        inner_indentation = _get_indentation(indentation_depth + 1)
+
+        if self.is_optional:
+            static_buffer.append(f"{outer_indentation}OPTIONAL {{\n")
+        elif self.is_union:
+            static_buffer.append(f"{outer_indentation}UNION\n{outer_indentation}{{\n")
+        else:
+            static_buffer.append(f"{outer_indentation}{{\n")
+
+        for entry in self.graph:
+            if isinstance(entry, Triple):
+                static_buffer.append(inner_indentation)
+                _flush_static(static_buffer, code_parts)
+                name = f"_t{len(namespace)}"
+                namespace[name] = entry
+                if type(entry) is Triple:
+                    code_parts.append(f'f"{{{name}.subject}} {{{name}.predicate}} {{{name}.object}} . \\n"')
+                else:
+                    # Subclasses may override get_text, so call it at render time
+                    code_parts.append(f"{name}.get_text()")
+            elif isinstance(entry, SPARQLGraphPattern):
+                entry._compile_parts(indentation_depth + 1, True, static_buffer, code_parts, namespace)
+            elif isinstance(entry, SPARQLSelectQuery):
+                # Nested select queries are rendered once per compilation; structural
+                # mutations trigger recompilation through the version check in compile()
+                nested_select_text = entry.get_text(indentation_depth=indentation_depth + 2)
+                static_buffer.append(f"{inner_indentation}{{{nested_select_text}{inner_indentation}}}\n")
+
+        for binding in self.bindings:
+            static_buffer.append(f"{inner_indentation}{binding.get_text()}\n")
+
+        for filter in self.filters:
+            static_buffer.append(f"{inner_indentation}{filter.get_text()}\n")
+
+        if trailing_newline:
+            static_buffer.append(f"{outer_indentation}}}\n")
+        else:
+            static_buffer.append(f"{outer_indentation}}}")
+
+    def _tree_version(self):
+        """
+        Returns the newest mutation stamp in the whole subtree rooted at this pattern.
+        The value strictly increases whenever this pattern or any nested pattern or query is mutated.
+        :return: <int> The subtree version.
+        """
+        version = self._version
+        for entry in self.graph:
+            if not isinstance(entry, Triple):
+                child_version = entry._tree_version()
+                if child_version > version:
+                    version = child_version
+        return version
+
+    def get_text(self, indentation_depth=0):
+        """
+        Generates the text for the SPARQL graph pattern.
+        :param indentation_depth: <int> A value that facilitates the appropriate addition of indents to the text. Defaults at 0.
+        :return: <str> The SPARQL graph pattern text. Returns empty string if an exception was raised.
+        """
+        parts = _acquire_parts()
+        try:
+            self._get_text_parts(indentation_depth, parts)
+            return "".join(parts)
+
+        except Exception as e:
+            print("Error 1 @ SPARQLGraphPattern.get_text()", e)
+            return ""
+
+        finally:
+            _release_parts(parts)
+
+    def _get_text_parts(self, indentation_depth, out, trailing_newline=True):
+        """
+        Appends the text fragments for the SPARQL graph pattern to a caller-supplied list.
+        :param indentation_depth: <int> A value that facilitates the appropriate addition of indents to the text.
+        :param out: <list> The list of string fragments to append to.
+        :param trailing_newline: <bool> If False, the newline after the closing brace is omitted.
+        """
+        # Reuse the memoized render if caching was requested and the subtree has
+        # not been mutated since; otherwise render straight into the caller's list
+        if self._cache_enabled:
+            cache_key = (indentation_depth, trailing_newline)
+            tree_version = self._tree_version()
+            cached = self._cache.get(cache_key)
+            if cached is not None and cached[0] == tree_version:
+                out.append(cached[1])
+                return
+            parts = _acquire_parts()
+        else:
+            parts = out
+
+        # Hoist bound methods out of the loops below
+        append = parts.append
+
+        # Calculate indentations
+        outer_indentation = _get_indentation(indentation_depth)
+        inner_indentation = _get_indentation(indentation_depth + 1)
+
+        # Initialize string
+        if self.is_optional:
+            append(f"{outer_indentation}OPTIONAL {{\n")
+        elif self.is_union:
+            append(f"{outer_indentation}UNION\n{outer_indentation}{{\n")
+        else:
+            append(f"{outer_indentation}{{\n")
+
+        # When the graph is a flat basic graph pattern (the common case), render all
+        # triples in one batch instead of dispatching per entry
+        if self._all_triples:
+            if _render_triples_fast is not None:
+                append(_render_triples_fast(inner_indentation, self.graph))
+            else:
+                parts.extend(f"{inner_indentation}{entry.get_text()}" for entry in self.graph)
+
+        # Otherwise dispatch on entry type via the renderer table
+        else:
+            renderers_get = _RENDERERS.get
+            for entry in self.graph:
+                entry_type = type(entry)
+                renderer = renderers_get(entry_type)
+                if renderer is None:
+                    renderer = _lookup_renderer(entry_type)
+                if renderer is not None:
+                    renderer(entry, parts, inner_indentation, indentation_depth)
+
+        # Add binding texts
+        for binding in self.bindings:
+            append(f"{inner_indentation}{binding.get_text()}\n")
+
+        # Add filter texts
+        for filter in self.filters:
+            append(f"{inner_indentation}{filter.get_text()}\n")
+
+        # Finalize graph text
+        if trailing_newline:
+            append(f"{outer_indentation}}}\n")
+        else:
+            append(f"{outer_indentation}}}")
+
+        # Memoize the render and hand it to the caller, displacing the stale entry
+        if self._cache_enabled:
+            text = "".join(parts)
+            _release_parts(parts)
+            self._cache[cache_key] = (tree_version, text)
+            out.append(text)
+
+
+class SPARQLQuery:
+    __slots__ = ("prefixes", "where", "_version", "_prefix_text")
+
+    def __init__(self, include_popular_prefixes=False):
+        """
+        The SPARQLQuery class constructor.
+        :param include_popular_prefixes: <bool> If True, a list of popular namespaces will be added automatically
+        """
+        self.prefixes = []
+        self.where = None
+        self._version = 0
+        # Cached render of the prefix block, invalidated whenever a prefix is added
+        self._prefix_text = None
+
+        if include_popular_prefixes:
+            self.add_popular_prefixes()
+
+    def add_prefix(self, prefix):
+        """
+        Adds a PREFIX expression to the graph pattern.
+        :param prefix: <obj> The Prefix object to be added.
+        :return: <bool> True if addition succeeded, False if the given object cannot render itself.
+        """
+        if __debug__ and _VALIDATE and not hasattr(prefix, "get_text"):
+            return False
+        self.prefixes.append(prefix)
+        self._version = next(_MUTATION_COUNTER)
+        self._prefix_text = None
+        return True
+
+    def add_popular_prefixes(self):
+        self.prefixes.extend(_POPULAR_PREFIXES)
+        self._version = next(_MUTATION_COUNTER)
+        self._prefix_text = None
+
+    def _get_prefix_text(self):
+        """
+        Returns the rendered prefix block, rebuilding it only when the prefix list has changed.
+        :return: <str> The concatenated PREFIX definition lines.
+        """
+        if self._prefix_text is None:
+            self._prefix_text = "".join(prefix.get_text() for prefix in self.prefixes)
+        return self._prefix_text
+
+    def _tree_version(self):
+        """
+        Returns the newest mutation stamp in the whole subtree rooted at this query.
+        The value strictly increases whenever the query or any nested pattern is mutated.
+        :return: <int> The subtree version.
+        """
+        version = self._version
+        if self.where is not None:
+            where_version = self.where._tree_version()
+            if where_version > version:
+                version = where_version
+        return version
+
+    def set_where_pattern(self, graph_pattern):
+        """
+        Sets the SPARQLGraphPattern object to be used at the WHERE part
+        :param graph_pattern: <obj> The SPARQLGraphPattern object to be used.
+        :return: <bool> True if setting succeeded, False if given argument was not a SPARQLGraphPattern object.
+        """
+        if isinstance(graph_pattern, SPARQLGraphPattern):
+            self.where = graph_pattern
+            self._version = next(_MUTATION_COUNTER)
+            return True
+        else:
+            return False
+
+
+class SPARQLSelectQuery(SPARQLQuery):
+    __slots__ = ("distinct", "limit", "variables", "group_by", "having", "order_by")
+
+    def __init__(self, distinct=False, limit=False, include_popular_prefixes=False):
+        """
+        The SPARQLSelectQuery class constructor.
+        :param distinct: <bool> Indicates if the select should be SELECT DISTINCT.
+        :param limit: <int> A limit to be used for the select query results.
+        """
+        SPARQLQuery.__init__(self, include_popular_prefixes)
+
+        self.distinct = distinct
+        self.limit = limit
+        self.variables = []
+        self.group_by = []
+        self.having = []
+        self.order_by = []
+
+    def add_variables(self, variables):
+        """
+        Adds a list of variables to be selected by the select query
+        :param variables: <list> A list of variables as strings.
+        :return: <bool> True if addition succeeded, False if given argument was not a list of strings.
+        """
+        if type(variables) is not list:
+            return False
+        if __debug__ and _VALIDATE and not all(isinstance(element, str) for element in variables):
+            return False
+        self.variables.extend(variables)
+        self._version = next(_MUTATION_COUNTER)
+        return True
+
+    def add_group_by(self, group):
+        """
+        Adds a GROUP BY expression to the query
+        :param group: <obj> The GroupBy object to be added
+        :return: <bool> True if addition succeeded, False if the given object cannot render itself.
+        """
+        if __debug__ and _VALIDATE and not hasattr(group, "get_text"):
+            return False
+        self.group_by.append(group)
+        self._version = next(_MUTATION_COUNTER)
+        return True
+
+    # MODIFICATION: The following method 'add_order_by' was added by GE Research as part of the ProCure project
+    def add_order_by(self, order):
+        """
+        Adds a ORDER BY expression to the query
+        :param group: <obj> The OrderBy object to be added
+        :return: <bool> True if addition succeeded, False if the given object cannot render itself.
+        """
+        if __debug__ and _VALIDATE and not hasattr(order, "get_text"):
+            return False
+        self.order_by.append(order)
+        self._version = next(_MUTATION_COUNTER)
+        return True
+
+    # MODIFICATION: The following method 'add_having' was added by GE Research as part of the ProCure project
+    def add_having(self, having):
+        self.having.append(having)
+        self._version = next(_MUTATION_COUNTER)
+        return True
+
+    def get_text(self, indentation_depth=0):
+        """
+        Generates the text for the SPARQL select query.
+        :param indentation_depth: <int> A value that facilitates the appropriate addition of indents to the text. Defaults at 0.
+        :return: <str> The SPARQL Select query text. Returns empty string if an exception was raised.
+        """
+        parts = _acquire_parts()
+        try:
+            self._get_text_parts(indentation_depth, parts)
+            return "".join(parts)
+
+        except Exception as e:
+            print("Error 1 @ SPARQLSelectQuery.get_text()", e)
+            return ""
+
+        finally:
+            _release_parts(parts)
+
+    def _get_text_parts(self, indentation_depth, out):
+        """
+        Appends the text fragments for the SPARQL select query to a caller-supplied list.
+        :param indentation_depth: <int> A value that facilitates the appropriate addition of indents to the text.
+        :param out: <list> The list of string fragments to append to.
+        """
+        # Calculate indentation
+        outer_indentation = _get_indentation(indentation_depth)
+
+        # Hoist the bound append out of the loops below
+        append = out.append
+
+        # Add prefixes
+        append(self._get_prefix_text())
+
+        # Add SELECT token
+        if self.distinct:
+            distinct_token = "DISTINCT "
+        else:
+            distinct_token = ""
+        append(f"\n{outer_indentation}SELECT {distinct_token}")
+
+        # If some variables have been defined, add them
+        if self.variables:
+            append(" ".join(self.variables))
+
+        # If no variable has been defined, use *
+        else:
+            append(" *")
+
+        # Add WHERE token
+        append(f"\n{outer_indentation}WHERE ")
+
+        # Add WHERE pattern graph
+        if self.where is not None:
+            self.where._get_text_parts(indentation_depth, out, trailing_newline=False)
+
+        # Add group by expressions
+        for group in self.group_by:
+            append(f"\n{outer_indentation}{group.get_text()}")
+
+        # MODIFICATION: The following for loop statement block was added by GE Research as part of the ProCure project
+        # Add having expressions
+        for have in self.having:
+            append(f"\n{outer_indentation}{have.get_text()}")
+
+        # MODIFICATION: The following for loop statement block was added by GE Research as part of the ProCure project
+        # Add order by expressions
+        for order in self.order_by:
+            append(f"\n{outer_indentation}{order.get_text()}")
+
+        # Add limit if required
+        if self.limit:
+            append(f"\nLIMIT {self.limit}")
+
+
+class SPARQLUpdateQuery(SPARQLQuery):
+    __slots__ = ("delete", "insert")
+
+    def __init__(self, include_popular_prefixes=False):
+        """
+        The SPARQLUpdateQuery class constructor.
+        """
+        SPARQLQuery.__init__(self, include_popular_prefixes)
+        self.delete = None
+        self.insert = None
+
+    def _tree_version(self):
+        """
+        Returns the newest mutation stamp in the whole subtree rooted at this query,
+        including the DELETE and INSERT patterns.
+        :return: <int> The subtree version.
+        """
+        version = SPARQLQuery._tree_version(self)
+        if self.delete is not None:
+            delete_version = self.delete._tree_version()
+            if delete_version > version:
+                version = delete_version
+        if self.insert is not None:
+            insert_version = self.insert._tree_version()
+            if insert_version > version:
+                version = insert_version
+        return version
+
+    def set_delete_pattern(self, graph_pattern):
+        """
+        Sets the SPARQLGraphPattern object to be used at the DELETE part
+        :param graph_pattern: <obj> The SPARQLGraphPattern object to be used.
+        :return: <bool> True if setting succeeded, False if given argument was not a SPARQLGraphPattern object.
+        """
+        if isinstance(graph_pattern, SPARQLGraphPattern):
+            self.delete = graph_pattern
+            self._version = next(_MUTATION_COUNTER)
+            return True
+        else:
+            return False
+
+    def set_insert_pattern(self, graph_pattern):
+        """
+        Sets the SPARQLGraphPattern object to be used at the INSERT part.
+        :param graph_pattern: <obj> The SPARQLGraphPattern object to be used.
+        :return: <bool> True if setting succeeded, False if given argument was not a SPARQLGraphPattern object.
+        """
+        if isinstance(graph_pattern, SPARQLGraphPattern):
+            self.insert = graph_pattern
+            self._version = next(_MUTATION_COUNTER)
+            return True
+        else:
+            return False
+
+    def get_text(self, indentation_depth=0):
+        """
+        Generates the text for the SPARQL update query.
+        :param indentation_depth: <int> A value that facilitates the appropriate addition of indents to the text. Defaults at 0.
+        :return: <str> The SPARQL Update query text. Returns empty string if an exception was raised.
+        """
+
+        parts = _acquire_parts()
+        try:
+            self._get_text_parts(indentation_depth, parts)
+            return "".join(parts)
+
+        except Exception as e:
+            print("Error 1 @ SPARQLUpdateQuery.get_text()", e)
+            return ""
+
+        finally:
+            _release_parts(parts)
+
+    def _get_text_parts(self, indentation_depth, out):
+        """
+        Appends the text fragments for the SPARQL update query to a caller-supplied list.
+        :param indentation_depth: <int> A value that facilitates the appropriate addition of indents to the text.
+        :param out: <list> The list of string fragments to append to.
+        """
+        # Calculate indentation
+        outer_indentation = _get_indentation(indentation_depth)
+
+        # Add prefixes
+        out.append(self._get_prefix_text())
+
+        # If a delete graph pattern has been defined
+        if self.delete is not None:
+
+            # Add DELETE token
+            out.append(f"\n{outer_indentation}DELETE ")
+
+            # Add DELETE pattern graph
+            self.delete._get_text_parts(indentation_depth, out, trailing_newline=False)
+
+        # If an insert graph pattern has been defined
+        if self.insert is not None:
+            # Add INSERT token
+            out.append(f"\n{outer_indentation}INSERT ")
+
+            # Add INSERT pattern graph
+            self.insert._get_text_parts(indentation_depth, out, trailing_newline=False)
+
+        # If a where graph pattern has been defined
+        if self.where is not None:
+            # Add WHERE token
+            out.append(f"\n{outer_indentation}WHERE ")
+
+            # Add WHERE pattern graph
+            self.where._get_text_parts(indentation_depth, out, trailing_newline=False)
+
+
+def _flush_static(static_buffer, code_parts):
+    """
+    Moves accumulated static text into the compiled source as a single string literal.
+    """
+    if static_buffer:
+        code_parts.append(repr("".join(static_buffer)))
+        static_buffer.clear()
+
+
+if _triple_line_fast is not None:
+    def _render_triple(entry, out, inner_indentation, indentation_depth):
+        """
+        Appends the text fragments for a Triple graph entry to the given list (C accelerated).
+        The helper itself falls back to entry.get_text() for Triple subclasses.
+        """
+        out.append(_triple_line_fast(inner_indentation, entry))
+else:
+    def _render_triple(entry, out, inner_indentation, indentation_depth):
+        """
+        Appends the text fragments for a Triple graph entry to the given list.
+        """
+        out.append(f"{inner_indentation}{entry.get_text()}")
+
+
+def _render_nested_graph_pattern(entry, out, inner_indentation, indentation_depth):
+    """
+    Appends the text fragments for a nested SPARQLGraphPattern graph entry to the given list.
+    """
+    entry._get_text_parts(indentation_depth + 1, out)
+
+
+def _render_nested_select_query(entry, out, inner_indentation, indentation_depth):
+    """
+    Appends the text fragments for a nested SPARQLSelectQuery graph entry to the given list.
+    """
+    out.append(f"{inner_indentation}{{")
+    entry._get_text_parts(indentation_depth + 2, out)
+    out.append(f"{inner_indentation}}}\n")
+
+
+# Renderer table used by SPARQLGraphPattern._get_text_parts to dispatch on graph entry type
+# with a single dict lookup instead of a chain of type tests
+_RENDERERS = {
+    Triple: _render_triple,
+    SPARQLGraphPattern: _render_nested_graph_pattern,
+    SPARQLSelectQuery: _render_nested_select_query,
+}
+
+
+def _lookup_renderer(entry_type):
+    """
+    Resolves the renderer for a subclass of one of the known graph entry types
+    and caches it in the renderer table for subsequent lookups.
+    :param entry_type: <type> The graph entry type to resolve.
+    :return: <function> The renderer, or None if the type is not a known entry type.
+    """
+    for base in entry_type.__mro__[1:]:
+        renderer = _RENDERERS.get(base)
+        if renderer is not None:
+            _RENDERERS[entry_type] = renderer
+            return renderer
+    return None
+
+
+if __name__ == "__main__":
+
+    # Create a graph pattern
+    pattern = SPARQLGraphPattern()
+
+    # Add a triple
+    pattern.add_triples(
+        triples=[
+            Triple(subject="?person", predicate="rdf:type", object="ex:Person"),
+            Triple(subject="?person", predicate="ex:hasName", object="?name")
+        ]
+    )
+
+    # Create a second graph pattern that should be OPTIONAL
+    optional_pattern = SPARQLGraphPattern(optional=True)
+
+    # Add a triple to the optional graph pattern
+    optional_pattern.add_triples(
+        triples=[
+            Triple(subject="?person", predicate="ex:hasAge", object="?age")
+        ]
+    )
+
+    # Add optional graph pattern as nested to the main graph pattern
+    pattern.add_nested_graph_pattern(optional_pattern)
+
+    print(pattern.get_text())
+
+    # Add some binding (BIND clause) to the main pattern.
+    pattern.add_binding(
+        binding=Binding(
+            value="\'John\'@en",
+            variable="?name"
+        )
+    )
+
+    # Add another binding where we will use a nested IF clause with a BOUND clause
+    pattern.add_binding(
+        binding=Binding(
+            value=IfClause(
+                condition=Bound(
+                    variable="?age"
+                ),
+                true_value="?age",
+                false_value="32"
+            ),
+            variable="?years"
+        )
+    )
+
+    # Add a filter for the age to the optional pattern
+    optional_pattern.add_filter(
+        filter=Filter(
+            expression="?age > 30"
+        )
+    )
+
+    # Print the graph query text
+    # print(pattern.get_text())
+
+    # Create a select query
+    select_query = SPARQLSelectQuery(
+        distinct=True,
+        limit=1000
+    )
+
+    # Add prefix "ex"
+    select_query.add_prefix(
+        prefix=Prefix(
+            prefix="ex",
+            namespace="http://www.example.com#"
+        )
+    )
+
+    # Add the variables for the selection
+    select_query.add_variables("?person")
+    select_query.add_variables("?years")
+
+    # Set the graph pattern that we created earlier as the WHERE pattern
+    select_query.set_where_pattern(graph_pattern=pattern)
+
+    # Add a GROUP BY to query
+    select_query.add_group_by(
+        group=GroupBy(
+            variables=["?person", "?age"]
+        )
+    )
+
+    # # Create another graph pattern
+    # pattern_3 = SPARQLGraphPattern()
+    # pattern_3.add_triple(
+    #     triple=Triple(
+    #         subject="?person",
+    #         predicate="rdf:type",
+    #         object="ex:Customer"
+    #     )
+    # )
+    #
+    # # Create a new select query to be nested in the first select query
+    # nested_select_query = SPARQLSelectQuery()
+    # nested_select_query.add_variable("?person")
+    # nested_select_query.set_where_pattern(
+    #     graph_pattern=pattern_3
+    # )
+    #
+    # # Set the second query as nested to the first graph pattern
+    # pattern.add_nested_select_query(
+    #     select_query=nested_select_query
+    # )
+
+    # Print the query text
+    # print(select_query.get_text())
+
+    #########################################
+    # delete_pattern = SPARQLGraphPattern()
+    # delete_pattern.add_triple(
+    #     Triple(
+    #         subject="?person",
+    #         predicate="ex:hasAge",
+    #         object="?age"
+    #     )
+    # )
+    #
+    # insert_pattern = SPARQLGraphPattern()
+    # insert_pattern.add_triple(
+    #     Triple(
+    #         subject="?person",
+    #         predicate="ex:hasAge",
+    #         object="32"
+    #     )
+    # )
+    #
+    # where_pattern = SPARQLGraphPattern()
+    # where_pattern.add_triple(
+    #     Triple(
+    #         subject="?person",
+    #         predicate="ex:hasAge",
+    #         object="?age"
+    #     )
+    # )
+    # where_pattern.add_triple(
+    #     Triple(
+    #         subject="?person",
+    #         predicate="ex:name",
+    #         object="John"
+    #     )
+    # )
+    #
+    # # Create an update query
+    # update_query = SPARQLUpdateQuery()
+    # update_query.add_prefix(
+    #     Prefix(
+    #         prefix="ex",
+    #         namespace="http://www.example.com#"
+    #     )
+    # )
+    # update_query.set_delete_pattern(graph_pattern=delete_pattern)
+    # update_query.set_insert_pattern(graph_pattern=insert_pattern)
+    # update_query.set_where_pattern(graph_pattern=insert_pattern)
+    #
+    # print(update_query.get_text())
+
+
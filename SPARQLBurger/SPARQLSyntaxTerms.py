@@ -28,17 +28,16 @@ class Prefix:
         """
         self.prefix = prefix
         self.namespace = namespace
+        # Prefix definitions are immutable in practice, so render once up front
+        self._rendered = "PREFIX %s: <%s>\n" % (prefix, namespace)
 
     def get_text(self):
         """
-        Generates the text for the given prefix (e.g. "PREFIX ex: <http://www.example.com#>")
-        :return: <str> The prefix definition text. Returns empty string if an exception was raised.
+        Returns the text for the given prefix (e.g. "PREFIX ex: <http://www.example.com#>"),
+        rendered once at construction time.
+        :return: <str> The prefix definition text.
         """
-        try:
-            return "PREFIX %s: <%s>\n" % (self.prefix, self.namespace)
-        except Exception as e:
-            print("Error 1 @ Prefix.get_text()")
-            return ""
+        return self._rendered
 
 
 class Triple:
@@ -0,0 +1,33 @@
+# cython: language_level=3
+"""
+SPARQL Burger - Optional Cython accelerator for the hot text-rendering paths.
+Built only when Cython is available at install time; SPARQLQueryBuilder falls
+back to the pure-Python renderers when this extension is missing.
+"""
+
+from SPARQLBurger.SPARQLSyntaxTerms import Triple
+
+
+cpdef str triple_line(str indentation, triple):
+    """
+    Renders a single indented triple line (e.g. "   ?s ?p ?o . \n").
+    Only exact Triple instances take the accelerated path; subclasses go
+    through their own get_text so overrides are honored.
+    """
+    if type(triple) is Triple:
+        return f"{indentation}{triple.subject} {triple.predicate} {triple.object} . \n"
+    return indentation + triple.get_text()
+
+
+cpdef str render_triples(str indentation, list triples):
+    """
+    Renders a batch of Triple objects into a single string of indented triple lines.
+    Entries that are not exact Triple instances are rendered via their get_text.
+    """
+    cdef list parts = []
+    for triple in triples:
+        if type(triple) is Triple:
+            parts.append(f"{indentation}{triple.subject} {triple.predicate} {triple.object} . \n")
+        else:
+            parts.append(indentation + triple.get_text())
+    return "".join(parts)
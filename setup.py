@@ -1,5 +1,17 @@
+import os
+
 import setuptools
 
+# The _fast extension is an optional accelerator; the package is pure Python without it.
+# Build it only when Cython is installed and the .pyx source is actually present.
+ext_modules = []
+if os.path.exists("SPARQLBurger/_fast.pyx"):
+    try:
+        from Cython.Build import cythonize
+        ext_modules = cythonize(["SPARQLBurger/_fast.pyx"], language_level=3)
+    except ImportError:
+        pass
+
 setuptools.setup(
     name="SPARQLBurger",
     version="0.0.1",
@@ -13,6 +25,7 @@ setuptools.setup(
         "Operating System :: OS Independent",
     ],
     install_requires=[],
+    ext_modules=ext_modules,
     #python_requires='>=3.9',
-    package_data={}
+    package_data={"SPARQLBurger": ["_fast.pyx"]}
 )